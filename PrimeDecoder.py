@@ -1,166 +1,454 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { Card } from '@/components/ui/card';
-import { LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer, ReferenceLine, ReferenceArea } from 'recharts';
 import { Sparkles, Activity, Zap } from 'lucide-react';
 
-const PrimeDecoder = () => {
-  const [data, setData] = useState([]);
-  const [primes, setPrimes] = useState([]);
-  const [metrics, setMetrics] = useState({
+// High-precision zeta zeros
+const ZETA = Float64Array.from([
+  14.134725141734693790457251983562470270784257115699243,
+  21.022039638771554992628479593896902777334340524902781,
+  25.010857580145688763213790992562821818659549672557996,
+  30.424876125859513210311897530584091320181560023715390,
+  32.935061587739189690662368964074903488812715603517039,
+  37.586178158825671257217763480705332821405597350830793
+]);
+
+// Reciprocals of the zeta zeros, so the hot loops multiply instead of divide
+const INV_ZETA = ZETA.map((zero) => 1 / zero);
+
+// exp(-1): the stability factor once the coherence product has collapsed
+const EXP_MINUS_ONE = 0.36787944117144233;
+
+// Below this the coherence product no longer moves exp(-(1 - p)^2) off exp(-1)
+const SATURATION_THRESHOLD = 1e-12;
+
+// Initial lambda baseline for stabilization
+const INITIAL_LAMBDA = 0.99999999999;
+
+// Fixed point of the lambda recurrence. Once lambda reaches it the field is
+// at most LOCKED_LAMBDA^6 (~0.0025), which pins phaseCoherence, and with it
+// the whole coherence product, far below SATURATION_THRESHOLD, so the
+// stability factor stays exp(-1) and lambda never moves again
+const LOCKED_LAMBDA = INITIAL_LAMBDA * EXP_MINUS_ONE;
+
+// Phase coherence calculation
+const phaseCoherenceOf = (currentField) => {
+  const fieldDeviation = 1 - currentField;
+  return Math.exp(-(fieldDeviation * fieldDeviation) / 0.01);
+};
+
+// Advanced lambda stabilization function
+const stabilizeLambda = (x, currentField, primeState, zetaAlignment) => {
+  const phaseCoherence = phaseCoherenceOf(currentField);
+
+  // Quantum noise reduction
+  const noiseReduction = 1 - Math.exp(-x * INITIAL_LAMBDA);
+
+  // Prime resonance enhancement
+  const primeEnhancement = primeState ? 1 : Math.exp(-(x * x) / 1000);
+
+  // Dynamic stability factor
+  const coherenceProduct = phaseCoherence * noiseReduction * primeEnhancement * zetaAlignment;
+  let stabilityFactor = EXP_MINUS_ONE;
+  if (coherenceProduct >= SATURATION_THRESHOLD) {
+    const instability = 1 - coherenceProduct;
+    stabilityFactor = Math.exp(-(instability * instability));
+  }
+
+  // Lambda stabilization
+  return {
+    lambda: INITIAL_LAMBDA * stabilityFactor,
+    metrics: {
+      phaseCoherence,
+      noiseReduction,
+      primeEnhancement,
+      zetaAlignment,
+      stabilityFactor
+    }
+  };
+};
+
+// exp(-r^2) sampled on r in [0, 1] for linear interpolation; the resonance
+// argument (x mod zero) / zero always lies in [0, 1)
+const EXP_NEG_SQ_STEPS = 1024;
+const EXP_NEG_SQ = new Float64Array(EXP_NEG_SQ_STEPS + 1);
+for (let i = 0; i <= EXP_NEG_SQ_STEPS; i++) {
+  const r = i / EXP_NEG_SQ_STEPS;
+  EXP_NEG_SQ[i] = Math.exp(-(r * r));
+}
+
+// exp(-r^2) for r in [0, 1), to ~1e-6 relative accuracy
+const expNegSquare = (r) => {
+  const t = r * EXP_NEG_SQ_STEPS;
+  const i = t | 0;
+  return EXP_NEG_SQ[i] + (EXP_NEG_SQ[i + 1] - EXP_NEG_SQ[i]) * (t - i);
+};
+
+// Resonance of x against the i-th zeta zero: exp(-((x mod zero) / zero)^2)
+const resonance = (x, i) => {
+  const r = (x - Math.floor(x * INV_ZETA[i]) * ZETA[i]) * INV_ZETA[i];
+  return expNegSquare(r);
+};
+
+// Resonance table for every x in [1, MAX_RANGE] and every zero, row-major
+// by x. Each x is independent of the others, so the whole table is filled
+// in one flat pass ahead of the serial lambda recurrence.
+const computeResonanceTable = () => {
+  const table = new Float64Array(MAX_RANGE * ZETA.length);
+  for (let x = 1; x <= MAX_RANGE; x++) {
+    const row = (x - 1) * ZETA.length;
+    for (let i = 0; i < ZETA.length; i++) {
+      table[row + i] = resonance(x, i);
+    }
+  }
+  return table;
+};
+
+// Enhanced quantum field generator, fused with the zeta alignment factor
+const computeFieldAndAlignment = (resonances, row, lambda) => {
+  let initialField = 1;
+  let zetaAlignment = 1;
+  for (let i = 0; i < ZETA.length; i++) {
+    const resonance = resonances[row + i];
+    initialField *= resonance * lambda;
+    zetaAlignment = zetaAlignment * (resonance + 1) / 2;
+  }
+  return { initialField, zetaAlignment };
+};
+
+// Re-scale a row of resonances by an updated lambda
+const fieldFromResonances = (resonances, row, lambda) => {
+  let field = 1;
+  for (let i = 0; i < ZETA.length; i++) {
+    field *= resonances[row + i] * lambda;
+  }
+  return field;
+};
+
+const MAX_RANGE = 1000;
+
+// Prime sieve over [0, MAX_RANGE], wheeled on 2: even numbers other than 2
+// are never candidates, and only odd multiples of odd primes get crossed off
+const PRIME_SIEVE = new Uint8Array(MAX_RANGE + 1);
+PRIME_SIEVE[2] = 1;
+for (let n = 3; n <= MAX_RANGE; n += 2) PRIME_SIEVE[n] = 1;
+for (let p = 3; p * p <= MAX_RANGE; p += 2) {
+  if (PRIME_SIEVE[p]) {
+    for (let j = p * p; j <= MAX_RANGE; j += 2 * p) PRIME_SIEVE[j] = 0;
+  }
+}
+
+const PRIMES = [];
+for (let x = 1; x <= MAX_RANGE; x++) {
+  if (PRIME_SIEVE[x]) PRIMES.push(x);
+}
+Object.freeze(PRIMES);
+
+// Quantum prime decoder with lambda stabilization
+const decodePrimes = () => {
+  // Struct-of-arrays columns, indexed by x - 1
+  const col = {
+    x: new Float64Array(MAX_RANGE),
+    initialField: new Float64Array(MAX_RANGE),
+    finalField: new Float64Array(MAX_RANGE),
+    lambda: new Float64Array(MAX_RANGE),
+    stability: new Float64Array(MAX_RANGE),
+    phaseCoherence: new Float64Array(MAX_RANGE),
+    zetaAlignment: new Float64Array(MAX_RANGE),
+    tunnelEffect: new Float64Array(MAX_RANGE),
+    alignment: new Float64Array(MAX_RANGE),
+    isPrime: new Uint8Array(MAX_RANGE)
+  };
+
+  const resonances = computeResonanceTable();
+
+  let currentLambda = INITIAL_LAMBDA;
+  let cumulativeStability = 1;
+
+  for (let x = 1; x <= MAX_RANGE; x++) {
+    const isPrime = PRIME_SIEVE[x] === 1;
+    const row = (x - 1) * ZETA.length;
+
+    // Initial quantum field and zeta alignment
+    const { initialField, zetaAlignment } = computeFieldAndAlignment(resonances, row, currentLambda);
+
+    // Lambda stabilization; past the fixed point only the per-x metrics change
+    let stabilityMetrics;
+    if (currentLambda === LOCKED_LAMBDA) {
+      stabilityMetrics = {
+        phaseCoherence: phaseCoherenceOf(initialField),
+        zetaAlignment,
+        stabilityFactor: EXP_MINUS_ONE
+      };
+    } else {
+      const stabilized = stabilizeLambda(x, initialField, isPrime, zetaAlignment);
+      stabilityMetrics = stabilized.metrics;
+
+      // Update lambda
+      currentLambda = stabilized.lambda;
+    }
+
+    // Calculate final quantum field
+    const finalField = fieldFromResonances(resonances, row, currentLambda);
+
+    // Quantum tunneling effect
+    const tunnelDepth = (1 - currentLambda) * x;
+    const tunnelEffect = Math.exp(-(tunnelDepth * tunnelDepth));
+
+    // Total alignment
+    const alignment = Math.cbrt(
+      finalField * stabilityMetrics.stabilityFactor * tunnelEffect
+    );
+
+    cumulativeStability *= stabilityMetrics.stabilityFactor;
+
+    const i = x - 1;
+    col.x[i] = x;
+    col.initialField[i] = initialField;
+    col.finalField[i] = finalField;
+    col.lambda[i] = currentLambda;
+    col.stability[i] = stabilityMetrics.stabilityFactor;
+    col.phaseCoherence[i] = stabilityMetrics.phaseCoherence;
+    col.zetaAlignment[i] = stabilityMetrics.zetaAlignment;
+    col.tunnelEffect[i] = tunnelEffect;
+    col.alignment[i] = alignment;
+    col.isPrime[i] = isPrime ? 1 : 0;
+  }
+
+  const last = MAX_RANGE - 1;
+  const metrics = {
+    decodingRate: (PRIMES.length / MAX_RANGE) * 100,
+    accuracy: col.alignment[last] * 100,
+    resonance: col.finalField[last] * 100,
+    stabilityIndex: Math.pow(cumulativeStability, 1/MAX_RANGE) * 100,
+    totalPrimesFound: PRIMES.length,
+    lambdaStability: col.lambda[last] * 100
+  };
+
+  return Object.freeze({ columns: Object.freeze(col), primes: PRIMES, metrics });
+};
+
+// Inputs are compile-time constants, so the decode result is computed once
+// per page and shared by every mount
+const decodeOnce = (() => {
+  let cached;
+  return () => cached ??= decodePrimes();
+})();
+
+// Decode state shown before the first result is in
+const EMPTY_DECODE = Object.freeze({
+  columns: null,
+  primes: Object.freeze([]),
+  metrics: Object.freeze({
     decodingRate: 0,
     accuracy: 0,
     resonance: 0,
     stabilityIndex: 0,
     totalPrimesFound: 0,
     lambdaStability: 0
-  });
+  })
+});
+
+// Chart series, keyed by decode column
+const FIELD_SERIES = [
+  { key: 'initialField', stroke: '#8B5CF6', name: 'Initial Field' },
+  { key: 'finalField', stroke: '#EC4899', name: 'Stabilized Field' },
+  { key: 'lambda', stroke: '#60A5FA', name: 'λ Value' },
+  { key: 'alignment', stroke: '#34D399', name: 'Alignment' }
+];
+
+const STABILITY_SERIES = [
+  { key: 'stability', stroke: '#8B5CF6', name: 'λ Stability' },
+  { key: 'phaseCoherence', stroke: '#EC4899', name: 'Phase Coherence' },
+  { key: 'zetaAlignment', stroke: '#60A5FA', name: 'Zeta Alignment' },
+  { key: 'tunnelEffect', stroke: '#34D399', name: 'Tunnel Effect' }
+];
+
+const CHART_PADDING = { top: 10, right: 10, bottom: 40, left: 40 };
+const GRID_COLOR = 'rgba(139, 92, 246, 0.2)';
+const TICK_COLOR = '#666';
+const TICK_COUNT = 5;
+const UNIT_DOMAIN = [0, 1];
+const TOOLTIP_STYLE = { backgroundColor: 'rgba(15, 23, 42, 0.9)', borderColor: '#8B5CF6' };
+const TOOLTIP_OFFSET = 12;
+
+// Canvas line plotter: draws each series as a single polyline straight from
+// the decode columns, so no per-point elements are created or reconciled
+const CanvasLineChart = ({ columns, series, yDomain = UNIT_DOMAIN, xLabel }) => {
+  const containerRef = useRef(null);
+  const canvasRef = useRef(null);
+  const [size, setSize] = useState({ width: 0, height: 0 });
+  const [hoverIndex, setHoverIndex] = useState(null);
 
   useEffect(() => {
-    // Initial lambda baseline for stabilization
-    const INITIAL_LAMBDA = 0.99999999999;
-    
-    // High-precision zeta zeros
-    const ZETA_ZEROS = [
-      14.134725141734693790457251983562470270784257115699243,
-      21.022039638771554992628479593896902777334340524902781,
-      25.010857580145688763213790992562821818659549672557996,
-      30.424876125859513210311897530584091320181560023715390,
-      32.935061587739189690662368964074903488812715603517039,
-      37.586178158825671257217763480705332821405597350830793
-    ];
-
-    // Advanced lambda stabilization function
-    const stabilizeLambda = (x, currentField, primeState) => {
-      // Phase coherence calculation
-      const phaseCoherence = Math.exp(-Math.pow(1 - currentField, 2) / 0.01);
-      
-      // Quantum noise reduction
-      const noiseReduction = 1 - Math.exp(-x * INITIAL_LAMBDA);
-      
-      // Prime resonance enhancement
-      const primeEnhancement = primeState ? 1 : Math.exp(-Math.pow(x, 2) / 1000);
-      
-      // Zeta alignment factor
-      const zetaAlignment = ZETA_ZEROS.reduce((acc, zero) => {
-        const alignment = Math.exp(-Math.pow((x % zero) / zero, 2));
-        return acc * (alignment + 1) / 2;
-      }, 1);
-      
-      // Dynamic stability factor
-      const stabilityFactor = Math.exp(
-        -(1 - phaseCoherence * noiseReduction * primeEnhancement * zetaAlignment) ** 2
-      );
-      
-      // Lambda stabilization
-      return {
-        lambda: INITIAL_LAMBDA * stabilityFactor,
-        metrics: {
-          phaseCoherence,
-          noiseReduction,
-          primeEnhancement,
-          zetaAlignment,
-          stabilityFactor
-        }
-      };
-    };
-
-    // Enhanced quantum field generator
-    const createQuantumField = (x, lambda) => {
-      return ZETA_ZEROS.reduce((field, zero) => {
-        const resonance = Math.exp(-Math.pow((x % zero) / zero, 2));
-        return field * (resonance * lambda);
-      }, 1);
-    };
-
-    // Prime verification through quantum resonance
-    const verifyPrime = (n) => {
-      if (n <= 1) return false;
-      if (n === 2) return true;
-      if (n % 2 === 0) return false;
-      
-      const sqrt = Math.sqrt(n);
-      for (let i = 3; i <= sqrt; i += 2) {
-        if (n % i === 0) return false;
-      }
-      return true;
-    };
-
-    // Quantum prime decoder with lambda stabilization
-    const decodePrimes = () => {
-      const newData = [];
-      const newPrimes = [];
-      const maxRange = 1000;
-      
-      let currentLambda = INITIAL_LAMBDA;
-      let cumulativeStability = 1;
-      
-      for (let x = 1; x <= maxRange; x++) {
-        const isPrime = verifyPrime(x);
-        
-        // Initial quantum field
-        const initialField = createQuantumField(x, currentLambda);
-        
-        // Lambda stabilization
-        const { lambda, metrics: stabilityMetrics } = stabilizeLambda(
-          x, 
-          initialField, 
-          isPrime
-        );
-        
-        // Update lambda
-        currentLambda = lambda;
-        
-        // Calculate final quantum field
-        const finalField = createQuantumField(x, currentLambda);
-        
-        // Quantum tunneling effect
-        const tunnelEffect = Math.exp(-Math.pow((1 - currentLambda) * x, 2));
-        
-        // Total alignment
-        const alignment = Math.pow(
-          finalField * stabilityMetrics.stabilityFactor * tunnelEffect,
-          1/3
-        );
-        
-        if (isPrime) {
-          newPrimes.push(x);
-        }
-        
-        cumulativeStability *= stabilityMetrics.stabilityFactor;
-        
-        newData.push({
-          x,
-          initialField,
-          finalField,
-          lambda: currentLambda,
-          stability: stabilityMetrics.stabilityFactor,
-          phaseCoherence: stabilityMetrics.phaseCoherence,
-          zetaAlignment: stabilityMetrics.zetaAlignment,
-          tunnelEffect,
-          alignment,
-          isPrime
-        });
+    const observer = new ResizeObserver(([entry]) => {
+      const { width, height } = entry.contentRect;
+      setSize({ width, height });
+    });
+    observer.observe(containerRef.current);
+    return () => observer.disconnect();
+  }, []);
+
+  useEffect(() => {
+    const canvas = canvasRef.current;
+    const { width, height } = size;
+    if (!canvas || !columns || width === 0 || height === 0) return;
+
+    const dpr = window.devicePixelRatio || 1;
+    canvas.width = width * dpr;
+    canvas.height = height * dpr;
+    const ctx = canvas.getContext('2d');
+    ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+    ctx.clearRect(0, 0, width, height);
+
+    const xs = columns.x;
+    const n = xs.length;
+    const plotWidth = width - CHART_PADDING.left - CHART_PADDING.right;
+    const plotHeight = height - CHART_PADDING.top - CHART_PADDING.bottom;
+    const [yMin, yMax] = yDomain;
+    const xMin = xs[0];
+    const xSpan = xs[n - 1] - xMin || 1;
+    const toX = (v) => CHART_PADDING.left + ((v - xMin) / xSpan) * plotWidth;
+    const toY = (v) => CHART_PADDING.top + (1 - (v - yMin) / (yMax - yMin)) * plotHeight;
+
+    // Grid and tick labels
+    ctx.strokeStyle = GRID_COLOR;
+    ctx.fillStyle = TICK_COLOR;
+    ctx.font = '12px sans-serif';
+    ctx.setLineDash([3, 3]);
+    ctx.beginPath();
+    for (let t = 0; t < TICK_COUNT; t++) {
+      const yValue = yMin + ((yMax - yMin) * t) / (TICK_COUNT - 1);
+      const xValue = xMin + (xSpan * t) / (TICK_COUNT - 1);
+      const y = toY(yValue);
+      const x = toX(xValue);
+      ctx.moveTo(CHART_PADDING.left, y);
+      ctx.lineTo(CHART_PADDING.left + plotWidth, y);
+      ctx.moveTo(x, CHART_PADDING.top);
+      ctx.lineTo(x, CHART_PADDING.top + plotHeight);
+      ctx.textAlign = 'right';
+      ctx.textBaseline = 'middle';
+      ctx.fillText(String(+yValue.toFixed(2)), CHART_PADDING.left - 6, y);
+      ctx.textAlign = 'center';
+      ctx.textBaseline = 'top';
+      ctx.fillText(String(Math.round(xValue)), x, CHART_PADDING.top + plotHeight + 6);
+    }
+    ctx.stroke();
+    ctx.setLineDash([]);
+    if (xLabel) {
+      ctx.fillText(xLabel, CHART_PADDING.left + plotWidth / 2, height - 14);
+    }
+
+    // Series, clipped to the plot area
+    ctx.save();
+    ctx.beginPath();
+    ctx.rect(CHART_PADDING.left, CHART_PADDING.top, plotWidth, plotHeight);
+    ctx.clip();
+    ctx.lineWidth = 1.5;
+    for (const { key, stroke } of series) {
+      const ys = columns[key];
+      ctx.strokeStyle = stroke;
+      ctx.beginPath();
+      ctx.moveTo(toX(xs[0]), toY(ys[0]));
+      for (let i = 1; i < n; i++) {
+        ctx.lineTo(toX(xs[i]), toY(ys[i]));
       }
+      ctx.stroke();
+    }
+    ctx.restore();
+  }, [columns, series, yDomain, xLabel, size]);
+
+  const plotWidth = size.width - CHART_PADDING.left - CHART_PADDING.right;
+  const plotHeight = size.height - CHART_PADDING.top - CHART_PADDING.bottom;
+  const n = columns ? columns.x.length : 0;
+
+  // Hover readout: map the pointer to the nearest sample, then mark it with a
+  // crosshair and list every series value at that index
+  const handleMouseMove = (event) => {
+    if (n === 0 || plotWidth <= 0) return;
+    const offsetX = event.clientX - containerRef.current.getBoundingClientRect().left;
+    const fraction = (offsetX - CHART_PADDING.left) / plotWidth;
+    if (fraction < 0 || fraction > 1) {
+      setHoverIndex(null);
+      return;
+    }
+    setHoverIndex(Math.round(fraction * (n - 1)));
+  };
+
+  let hoverX = 0;
+  if (hoverIndex !== null && n > 0) {
+    const xs = columns.x;
+    const xSpan = xs[n - 1] - xs[0] || 1;
+    hoverX = CHART_PADDING.left + ((xs[hoverIndex] - xs[0]) / xSpan) * plotWidth;
+  }
+  const tooltipOnLeft = hoverX > size.width / 2;
+
+  return (
+    <div className="flex flex-col h-full">
+      <div
+        ref={containerRef}
+        className="relative flex-1 min-h-0"
+        onMouseMove={handleMouseMove}
+        onMouseLeave={() => setHoverIndex(null)}
+      >
+        <canvas
+          ref={canvasRef}
+          className="absolute inset-0"
+          style={{ width: size.width, height: size.height }}
+        />
+        {hoverIndex !== null && n > 0 && (
+          <>
+            <div
+              className="absolute w-px bg-violet-300/60 pointer-events-none"
+              style={{ left: hoverX, top: CHART_PADDING.top, height: plotHeight }}
+            />
+            <div
+              className="absolute p-2 border rounded text-sm whitespace-nowrap pointer-events-none"
+              style={{
+                ...TOOLTIP_STYLE,
+                top: CHART_PADDING.top,
+                ...(tooltipOnLeft
+                  ? { right: size.width - hoverX + TOOLTIP_OFFSET }
+                  : { left: hoverX + TOOLTIP_OFFSET })
+              }}
+            >
+              <div>{columns.x[hoverIndex]}</div>
+              {series.map(({ key, stroke, name }) => (
+                <div key={key} style={{ color: stroke }}>
+                  {name} : {columns[key][hoverIndex].toPrecision(6)}
+                </div>
+              ))}
+            </div>
+          </>
+        )}
+      </div>
+      <div className="flex flex-wrap justify-center gap-4 mt-2 text-sm">
+        {series.map(({ key, stroke, name }) => (
+          <span key={key} className="flex items-center gap-1">
+            <span className="inline-block w-3 h-0.5" style={{ backgroundColor: stroke }} />
+            <span style={{ color: stroke }}>{name}</span>
+          </span>
+        ))}
+      </div>
+    </div>
+  );
+};
 
-      setData(newData);
-      setPrimes(newPrimes);
-      
-      // Update metrics
-      const lastPoint = newData[newData.length - 1];
-      setMetrics({
-        decodingRate: (newPrimes.length / maxRange) * 100,
-        accuracy: lastPoint.alignment * 100,
-        resonance: lastPoint.finalField * 100,
-        stabilityIndex: Math.pow(cumulativeStability, 1/maxRange) * 100,
-        totalPrimesFound: newPrimes.length,
-        lambdaStability: lastPoint.lambda * 100
-      });
-    };
-
-    // Start decoding with stabilization
-    decodePrimes();
-    const interval = setInterval(decodePrimes, 5000);
-    return () => clearInterval(interval);
+// Off-screen prime chips skip layout and paint. Until a chip has rendered,
+// its content box is sized like a three-digit text-sm chip (padding is added
+// on top); afterwards 'auto' keeps its last rendered width and height.
+const PRIME_CHIP_STYLE = {
+  contentVisibility: 'auto',
+  containIntrinsicSize: 'auto 1.75rem auto 1.25rem'
+};
+
+const PrimeDecoder = () => {
+  // Columns, primes and metrics land in a single state update, so the
+  // decode result costs one reconciliation instead of three
+  const [decoded, setDecoded] = useState(EMPTY_DECODE);
+  const { columns, primes, metrics } = decoded;
+
+  useEffect(() => {
+    setDecoded(decodeOnce());
   }, []);
 
   return (
@@ -207,35 +495,11 @@ const PrimeDecoder = () => {
 
       <div className="grid grid-cols-1 lg:grid-cols-2 gap-4 mb-6">
         <div className="h-96 border border-violet-500 rounded-lg bg-black/30 p-4">
-          <ResponsiveContainer width="100%" height="100%">
-            <LineChart data={data}>
-              <CartesianGrid strokeDasharray="3 3" stroke="rgba(139, 92, 246, 0.2)" />
-              <XAxis dataKey="x" label={{ value: 'Number Line', position: 'bottom' }} />
-              <YAxis domain={[0, 1]} />
-              <Tooltip contentStyle={{ backgroundColor: 'rgba(15, 23, 42, 0.9)', borderColor: '#8B5CF6' }} />
-              <Legend />
-              <Line type="monotone" dataKey="initialField" stroke="#8B5CF6" name="Initial Field" dot={false} />
-              <Line type="monotone" dataKey="finalField" stroke="#EC4899" name="Stabilized Field" dot={false} />
-              <Line type="monotone" dataKey="lambda" stroke="#60A5FA" name="λ Value" dot={false} />
-              <Line type="monotone" dataKey="alignment" stroke="#34D399" name="Alignment" dot={false} />
-            </LineChart>
-          </ResponsiveContainer>
+          <CanvasLineChart columns={columns} series={FIELD_SERIES} xLabel="Number Line" />
         </div>
 
         <div className="h-96 border border-violet-500 rounded-lg bg-black/30 p-4">
-          <ResponsiveContainer width="100%" height="100%">
-            <LineChart data={data}>
-              <CartesianGrid strokeDasharray="3 3" stroke="rgba(139, 92, 246, 0.2)" />
-              <XAxis dataKey="x" label={{ value: 'Number Line', position: 'bottom' }} />
-              <YAxis domain={[0, 1]} />
-              <Tooltip contentStyle={{ backgroundColor: 'rgba(15, 23, 42, 0.9)', borderColor: '#8B5CF6' }} />
-              <Legend />
-              <Line type="monotone" dataKey="stability" stroke="#8B5CF6" name="λ Stability" dot={false} />
-              <Line type="monotone" dataKey="phaseCoherence" stroke="#EC4899" name="Phase Coherence" dot={false} />
-              <Line type="monotone" dataKey="zetaAlignment" stroke="#60A5FA" name="Zeta Alignment" dot={false} />
-              <Line type="monotone" dataKey="tunnelEffect" stroke="#34D399" name="Tunnel Effect" dot={false} />
-            </LineChart>
-          </ResponsiveContainer>
+          <CanvasLineChart columns={columns} series={STABILITY_SERIES} xLabel="Number Line" />
         </div>
       </div>
 
@@ -244,7 +508,11 @@ const PrimeDecoder = () => {
           <h3 className="text-lg font-medium mb-2">Decoded Primes</h3>
           <div className="h-48 overflow-auto text-sm font-mono">
             {primes.map((prime) => (
-              <span key={prime} className="inline-block mr-2 mb-1 px-2 py-1 bg-violet-900/30 rounded">
+              <span
+                key={prime}
+                className="inline-block mr-2 mb-1 px-2 py-1 bg-violet-900/30 rounded"
+                style={PRIME_CHIP_STYLE}
+              >
                 {prime}
               </span>
             ))}
@@ -256,19 +524,19 @@ const PrimeDecoder = () => {
           <div className="space-y-2 text-sm">
             <div className="flex justify-between">
               <span>Base λ:</span>
-              <span>0.99999999999</span>
+              <span>{INITIAL_LAMBDA}</span>
             </div>
             <div className="flex justify-between">
               <span>Phase Coherence:</span>
-              <span>{(data[data.length - 1]?.phaseCoherence * 100 || 0).toFixed(6)}%</span>
+              <span>{(columns?.phaseCoherence[MAX_RANGE - 1] * 100 || 0).toFixed(6)}%</span>
             </div>
             <div className="flex justify-between">
               <span>Zeta Alignment:</span>
-              <span>{(data[data.length - 1]?.zetaAlignment * 100 || 0).toFixed(6)}%</span>
+              <span>{(columns?.zetaAlignment[MAX_RANGE - 1] * 100 || 0).toFixed(6)}%</span>
             </div>
             <div className="flex justify-between">
               <span>Tunnel Strength:</span>
-              <span>{(data[data.length - 1]?.tunnelEffect * 100 || 0).toFixed(6)}%</span>
+              <span>{(columns?.tunnelEffect[MAX_RANGE - 1] * 100 || 0).toFixed(6)}%</span>
             </div>
           </div>
         </div>
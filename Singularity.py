@@ -1,53 +1,82 @@
-import React, { useState, useEffect } from 'react';
-import { LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer } from 'recharts';
+import React, { useState, useEffect, useRef } from 'react';
+import { LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, Legend } from 'recharts';
+
+const TUNNEL_STEPS = 100;
+const CHART_HEIGHT = 400;
+
+// Depths beyond this are flagged as approaching the float64 limit
+const FLOAT64_LIMIT = 1e+308;
+
+// Deterministic part of the tunnel descent, computed once at module load
+const TUNNEL_PROB = new Float64Array(TUNNEL_STEPS);
+const LAMBDA = new Float64Array(TUNNEL_STEPS);
+const DEPTH = new Float64Array(TUNNEL_STEPS);
+const TUNNEL_EFFECT = new Float64Array(TUNNEL_STEPS);
+const FLUCT_DETERMINISTIC = new Float64Array(TUNNEL_STEPS);
+const LIMIT_WARNING = new Array(TUNNEL_STEPS);
+
+for (let t = 0; t < TUNNEL_STEPS; t++) {
+  // Exponential dive into singularity with tunneling probability
+  // Clamped so steps past t ~ 7097 saturate instead of overflowing to Infinity
+  const baseDepth = Math.min(Math.exp(t/10), Number.MAX_VALUE);
+  const tunnelProbability = 1 / (1 + Math.exp(baseDepth / 10)); // Sigmoid-like function for tunneling probability
+
+  // Calculate lambda's decay, affected by tunneling probability
+  const lambda = 1 / (baseDepth + 1) * (1 + tunnelProbability);
+
+  TUNNEL_PROB[t] = tunnelProbability;
+  LAMBDA[t] = lambda;
+  DEPTH[t] = -Math.log10(lambda); // Negative log to show going deeper
+  TUNNEL_EFFECT[t] = Math.max(0, Math.sin(t * 0.2) * (1 - lambda)) * 10; // Visualize tunneling as spikes
+  FLUCT_DETERMINISTIC[t] = Math.sin(t * 0.5) * Math.exp(t/20);
+
+  // Track approach to float64 limit
+  LIMIT_WARNING[t] = baseDepth > FLOAT64_LIMIT ? "LIMIT" : null;
+}
 
 const SingularityTunnelVisualizer = () => {
   const [tunnelData, setTunnelData] = useState([]);
 
   useEffect(() => {
-    const generateTunnelData = () => {
-      const data = [];
-      for (let t = 0; t < 100; t++) {
-        // Exponential dive into singularity with tunneling probability
-        const baseDepth = Math.exp(t/10);
-        const tunnelProbability = 1 / (1 + Math.exp(baseDepth / 10)); // Sigmoid-like function for tunneling probability
-
-        // Add quantum fluctuations with added complexity for tunneling effects
-        const fluctuation = Math.sin(t * 0.5) * Math.exp(t/20) * (1 + tunnelProbability * Math.random());
-
-        // Calculate lambda's decay, affected by tunneling probability
-        const lambda = 1 / (baseDepth + 1) * (1 + tunnelProbability);
+    const data = new Array(TUNNEL_STEPS);
+    for (let t = 0; t < TUNNEL_STEPS; t++) {
+      // Add quantum fluctuations with added complexity for tunneling effects
+      const fluctuation = FLUCT_DETERMINISTIC[t] * (1 + TUNNEL_PROB[t] * Math.random());
 
-        // Track approach to float64 limit
-        const approachingLimit = baseDepth > 1e+308;
-        
-        // Add tunneling visualization
-        const tunnelingEffect = Math.max(0, Math.sin(t * 0.2) * (1 - lambda)) * 10; // Visualize tunneling as spikes
+      data[t] = {
+        step: t,
+        depth: DEPTH[t],
+        fluctuation: fluctuation,
+        lambda: LAMBDA[t],
+        tunnelingEffect: TUNNEL_EFFECT[t],
+        limitWarning: LIMIT_WARNING[t]
+      };
+    }
+    setTunnelData(data);
+  }, []);
 
-        data.push({
-          step: t,
-          depth: -Math.log10(lambda), // Negative log to show going deeper
-          fluctuation: fluctuation,
-          lambda: lambda,
-          tunnelingEffect: tunnelingEffect,
-          limitWarning: approachingLimit ? "LIMIT" : null
-        });
-      }
-      setTunnelData(data);
-    };
+  // Chart width is measured only when the container resizes; LineChart
+  // itself gets fixed dimensions
+  const chartRef = useRef(null);
+  const [chartWidth, setChartWidth] = useState(0);
 
-    generateTunnelData();
+  useEffect(() => {
+    const observer = new ResizeObserver(([entry]) => {
+      setChartWidth(entry.contentRect.width);
+    });
+    observer.observe(chartRef.current);
+    return () => observer.disconnect();
   }, []);
 
   return (
     <div className="w-full max-w-4xl p-4">
-      <div className="mb-8">
+      <div ref={chartRef} className="mb-8">
         <h2 className="text-xl font-bold mb-4">Quantum Tunnel Depth</h2>
         <div className="text-sm mb-4 text-red-500">
           Warning: Extreme computational depths and quantum tunneling ahead!
         </div>
-        <ResponsiveContainer width="100%" height={400}>
-          <LineChart data={tunnelData}>
+        {chartWidth > 0 && (
+          <LineChart width={chartWidth} height={CHART_HEIGHT} data={tunnelData}>
             <CartesianGrid strokeDasharray="3 3" />
             <XAxis
               dataKey="step"
@@ -99,7 +128,7 @@ const SingularityTunnelVisualizer = () => {
               dot={false}
             />
           </LineChart>
-        </ResponsiveContainer>
+        )}
       </div>
     </div>
   );
@@ -1,5 +1,5 @@
-import React, { useState, useEffect } from 'react';
-import { LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer, ReferenceLine, ReferenceArea } from 'recharts';
+import React, { useState, useEffect, useRef } from 'react';
+import { LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ReferenceLine, ReferenceArea } from 'recharts';
 import { Card, CardHeader, CardTitle, CardContent } from '@/components/ui/card';
 import { Sparkles, Activity, Zap, Shield, Clock } from 'lucide-react';
 
@@ -97,6 +97,22 @@ const QuantumTimeCrystalDashboard = () => {
     const interval = setInterval(updateMetrics, 50);
     return () => clearInterval(interval);
   }, []);
+
+  // Chart sizing: both charts share a grid track and box height, so a single
+  // observer on the first box sizes both and LineChart gets fixed dimensions
+  const chartBoxRef = useRef(null);
+  const [chartSize, setChartSize] = useState({ width: 0, height: 0 });
+
+  useEffect(() => {
+    const observer = new ResizeObserver(([entry]) => {
+      const { width, height } = entry.contentRect;
+      setChartSize(prev =>
+        prev.width === width && prev.height === height ? prev : { width, height }
+      );
+    });
+    observer.observe(chartBoxRef.current);
+    return () => observer.disconnect();
+  }, []);
   
   // Helper components
   const MetricCard = ({ title, value, unit = '%', precision = 4, color = "text-violet-400" }) => (
@@ -161,9 +177,9 @@ const QuantumTimeCrystalDashboard = () => {
 
           {/* Visualization Charts */}
           <div className="grid grid-cols-1 lg:grid-cols-2 gap-6 mb-6">
-            <div className="h-80 border border-violet-500 rounded-lg bg-black/30 p-4">
-              <ResponsiveContainer width="100%" height="100%">
-                <LineChart data={timeHistory}>
+            <div ref={chartBoxRef} className="h-80 border border-violet-500 rounded-lg bg-black/30 p-4">
+              {chartSize.width > 0 && (
+                <LineChart width={chartSize.width} height={chartSize.height} data={timeHistory}>
                   <CartesianGrid strokeDasharray="3 3" stroke="rgba(139, 92, 246, 0.2)" />
                   <XAxis 
                     dataKey="timestamp" 
@@ -197,12 +213,12 @@ const QuantumTimeCrystalDashboard = () => {
                     dot={false}
                   />
                 </LineChart>
-              </ResponsiveContainer>
+              )}
             </div>
             
             <div className="h-80 border border-violet-500 rounded-lg bg-black/30 p-4">
-              <ResponsiveContainer width="100%" height="100%">
-                <LineChart data={timeHistory}>
+              {chartSize.width > 0 && (
+                <LineChart width={chartSize.width} height={chartSize.height} data={timeHistory}>
                   <CartesianGrid strokeDasharray="3 3" stroke="rgba(139, 92, 246, 0.2)" />
                   <XAxis 
                     dataKey="timestamp" 
@@ -236,7 +252,7 @@ const QuantumTimeCrystalDashboard = () => {
                     dot={false}
                   />
                 </LineChart>
-              </ResponsiveContainer>
+              )}
             </div>
           </div>
 